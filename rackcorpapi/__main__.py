@@ -1,12 +1,22 @@
 import logging
 import os
+import requests
 import sys
 import time
 
 from . import client, dns
 
+try:
+    import dns.exception as dnsexception
+    import dns.resolver as dnsresolver
+except ImportError:
+    dnsresolver = None
+
 logger = logging.getLogger(__name__)
 
+PROPAGATION_TIMEOUT = 30  # seconds
+PROPAGATION_FALLBACK_DELAY = 10  # seconds, used without dnspython
+
 
 def _prepare_new_record() -> dns.DnsRecord:
     """
@@ -32,24 +42,103 @@ def _prepare_new_record() -> dns.DnsRecord:
 
 
 def _find_domain_id(client: client.Client, record: dns.DnsDomain) -> str:
-    domains = client.dns.domain_getall()
-    for d in domains:
-        if d.name == record.domain_name:
-            return d.id
-    return None
+    # The cached list may predate the zone, so check a fresh one before giving up.
+    dom = client.dns.domain_index().get(record.domain_name)
+    if dom is None:
+        dom = client.dns.domain_index(refresh=True).get(record.domain_name)
+    return dom.id if dom else None
 
 
 def _find_record_id(client: client.Client, record: dns.DnsDomain) -> str:
     """
     Find the record ID for an existing DNS record.
+
+    Updates record.domain_id if the cached domain list had a stale id.
     """
-    dom = client.dns.domain_get(record.domain_id)
+    try:
+        dom = client.dns.domain_get(record.domain_id)
+    except requests.RequestException:
+        # The zone may have been re-created since the domain list was cached.
+        fresh = client.dns.domain_index(refresh=True).get(record.domain_name)
+        if fresh is None or fresh.id == record.domain_id:
+            raise
+        logger.debug("domain %s is stale, retrying with %s", record.domain_id, fresh.id)
+        record.domain_id = fresh.id
+        dom = client.dns.domain_get(record.domain_id)
     for r in dom.records:
         if r.lookup == record.lookup and r.type == record.type:
             return r.id
     return None
 
 
+def _authoritative_resolver(zone_name: str) -> "dnsresolver.Resolver":
+    """
+    Build a resolver that queries the zone's own name servers directly.
+    """
+    addrs = []
+    for ns in dnsresolver.resolve(zone_name, "NS"):
+        try:
+            addrs.extend(a.address for a in dnsresolver.resolve(ns.target, "A"))
+        except dnsexception.DNSException as e:
+            logger.debug("cannot resolve name server %s: %s", ns.target, e)
+    if not addrs:
+        raise dnsexception.DNSException(f"No name servers found for {zone_name}")
+
+    resolver = dnsresolver.Resolver(configure=False)
+    resolver.nameservers = addrs
+    return resolver
+
+
+def _wait_for_propagation(record: dns.DnsRecord) -> bool:
+    """
+    Poll the zone's name servers until they serve the new TXT record.
+
+    If the name servers cannot be found, pause for PROPAGATION_FALLBACK_DELAY
+    instead, as the hook did before polling was added.
+
+    :return: True if the record was seen before PROPAGATION_TIMEOUT.
+    """
+    fqdn = f"{record.lookup}.{record.domain_name}"
+    deadline = time.monotonic() + PROPAGATION_TIMEOUT
+    delay = 0.5
+    try:
+        resolver = _authoritative_resolver(record.domain_name)
+    except dnsexception.DNSException as e:
+        logger.warning(
+            "Cannot find name servers for '%s' (%s), pausing %ss instead",
+            record.domain_name,
+            e,
+            PROPAGATION_FALLBACK_DELAY,
+        )
+        time.sleep(PROPAGATION_FALLBACK_DELAY)
+        return False
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            answer = resolver.resolve(fqdn, "TXT", lifetime=remaining)
+            for rdata in answer:
+                if b"".join(rdata.strings).decode() == record.data:
+                    return True
+        except dnsexception.DNSException as e:
+            logger.debug("TXT lookup for %s failed: %s", fqdn, e)
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 5)
+
+    logger.warning(
+        "Record %s not yet visible after %ss, continuing anyway",
+        fqdn,
+        PROPAGATION_TIMEOUT,
+    )
+    return False
+
+
 class CertbotAuthHook:
     def main(self) -> int:
         """
@@ -80,8 +169,12 @@ class CertbotAuthHook:
             logger.info(f"Creating record {new_record.lookup}.{new_record.domain_name}")
             self.client.dns.record_create(new_record)
 
-        logger.info("Pausing to allow for DNS propagation")
-        time.sleep(10)
+        if dnsresolver is None:
+            logger.info("Pausing to allow for DNS propagation")
+            time.sleep(PROPAGATION_FALLBACK_DELAY)
+        else:
+            logger.info("Waiting for DNS propagation")
+            _wait_for_propagation(new_record)
         return 0
 
 
@@ -0,0 +1,244 @@
+"""
+Asynchronous Rackcorp API client.
+
+Requires the optional ``async`` dependencies (httpx with HTTP/2 support), so
+it is not imported by the ``rackcorpapi`` package itself.
+"""
+
+from . import api, cred, dns, jsonlib
+import httpx
+import logging
+import platform
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class _asyncApi:
+    """
+    Internal class to interact with the Rackcorp API asynchronously.
+    """
+
+    def __init__(
+        self,
+        cred: cred.ApiCredential,
+        base_url: str,
+        api_version: str,
+        user_agent: str,
+        transport: httpx.AsyncBaseTransport = None,
+    ):
+        if not base_url.endswith("/"):
+            base_url += "/"
+
+        self.cred = cred
+        self.base_url = base_url
+        self.api_version = api_version
+        self.user_agent = user_agent
+        self._prefix = base_url + api_version + "/"
+        self._legacy_url = base_url + "rest/" + api_version + "/json.php"
+        self.client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=8),
+            headers={
+                "Accept": "application/json",
+                "User-Agent": user_agent,
+            },
+            auth=httpx.BasicAuth(cred.api_uuid, cred.api_secret),
+            timeout=30,  # seconds
+            transport=transport,
+        )
+
+    async def api_request(self, method: str, url: str, req_body=None) -> httpx.Response:
+        content = None
+        headers = None
+        if req_body is not None:
+            content = jsonlib.dumps(req_body)
+            headers = {"Content-Type": "application/json"}
+        resp = await self.client.request(
+            method,
+            url,
+            content=content,
+            headers=headers,
+        )
+        logger.debug("request: %s %s", resp.request.method, resp.request.url)
+        logger.debug("response: %s", resp.status_code)
+        return resp
+
+    async def api_get(self, url_suffix: str) -> httpx.Response:
+        return await self.api_request("GET", self._prefix + url_suffix)
+
+    async def api_legacy_post(self, req_body) -> httpx.Response:
+        return await self.api_request("POST", self._legacy_url, req_body)
+
+    def parse_response(self, response: httpx.Response) -> dict:
+        """
+        Check a response and parse its JSON body exactly once.
+
+        :return: The parsed JSON body.
+        """
+        if response.status_code != 200:
+            # Raise the same exception type as the sync client, not httpx's.
+            raise requests.HTTPError(
+                f"Error {response.status_code}: {response.text}", response=response
+            )
+
+        body = api.parse_json(response)
+        api._api.raise_if_json_code_not_ok(body)
+        return body
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+class _asyncDnsOperations:
+
+    def __init__(self, api: _asyncApi):
+        self._api = api
+
+    async def domain_getall(self) -> list[dns.DnsDomain]:
+        """
+        Get all domains from the Rackcorp API.
+
+        :return: A list of domains.
+        """
+        response = await self._api.api_get("dns/domain")
+        body = self._api.parse_response(response)
+
+        return [dns.DnsDomain.from_dict(dom) for dom in body.get("data", ())]
+
+    async def domain_get(self, domain_id: str) -> dns.DnsDomain:
+        """
+        Get a single domain from the Rackcorp API.
+
+        :return: A domains with a list of records.
+        """
+        response = await self._api.api_get(f"dns/domain/{domain_id}")
+        body = self._api.parse_response(response)
+        return dns.DnsDomain.from_dict(body["data"])
+
+    async def record_get(self, record_id: str) -> dns.DnsRecord:
+        """
+        Get a single DNS record from the Rackcorp API.
+
+        :return: A record.
+        """
+        response = await self._api.api_get(f"dns/records/{record_id}")
+        body = self._api.parse_response(response)
+        return dns.DnsRecord.from_dict(body["data"])
+
+    async def record_delete(self, record_id: str) -> None:
+        """
+        Delete a single DNS record from the Rackcorp API.
+
+        :return: None.
+        """
+        response = await self._api.api_legacy_post(
+            {
+                "cmd": "dns.record.delete",
+                "id": record_id,
+            }
+        )
+        self._api.parse_response(response)
+        return None
+
+    async def record_create(self, record: dns.DnsRecord) -> dns.DnsRecord:
+        """
+        Create a new DNS record in the Rackcorp API.
+
+        :return: The created record.
+        """
+        d = record.to_dict()
+
+        if "domainid" not in d and "name" not in d:
+            raise ValueError("Either domain_id or domain_name must be provided")
+
+        req_body = {"cmd": "dns.record.create", "data": {0: d}}
+
+        response = await self._api.api_legacy_post(req_body)
+        body = self._api.parse_response(response)
+        return dns.DnsRecord.from_dict(body["data"][0])
+
+    async def record_update(self, record: dns.DnsRecord) -> dns.DnsRecord:
+        """
+        Update an existing DNS record in the Rackcorp API.
+
+        :return: The updated record.
+        """
+        return (await self.record_update_many([record]))[0]
+
+    async def record_update_many(
+        self, records: list[dns.DnsRecord]
+    ) -> list[dns.DnsRecord]:
+        """
+        Update several existing DNS records in a single Rackcorp API request.
+
+        :return: The updated records.
+        """
+        if not records:
+            return []
+
+        req_body = {
+            "cmd": "dns.record.update",
+            "data": dns._record_update_data(records),
+        }
+
+        response = await self._api.api_legacy_post(req_body)
+        body = self._api.parse_response(response)
+        return [dns.DnsRecord.from_dict(r) for r in body["data"]]
+
+
+class AsyncClient:
+    """
+    Rackcorp API class to interact with the Rackcorp API using asyncio.
+
+    All requests share one HTTP/2 connection, so independent operations can
+    overlap, e.g.::
+
+        async with AsyncClient() as client:
+            await asyncio.gather(*[client.dns.record_update(r) for r in records])
+    """
+
+    def __init__(
+        self,
+        credential: cred.ApiCredential = None,
+        base_url: str = "https://api.rackcorp.net/api/",
+        api_version: str = "v2.8",
+        user_agent: str = None,
+        transport: httpx.AsyncBaseTransport = None,
+    ):
+        """
+        Initialize the AsyncClient class with an API credential
+
+        :param cred: The API credentials
+        :param transport: An httpx transport to use instead of the default
+            HTTP/2 one, e.g. httpx.MockTransport in tests
+        """
+        if credential is None:
+            credential = cred.get_api_credentials()
+        if credential is None:
+            raise ValueError("Rackcorp API credentials are required")
+
+        if user_agent is None:
+            user_agent = f"rackcorpapi/0.1 python/{platform.python_version()}"
+
+        self.api = _asyncApi(
+            cred=credential,
+            base_url=base_url,
+            api_version=api_version,
+            user_agent=user_agent,
+            transport=transport,
+        )
+
+        self.dns = _asyncDnsOperations(self.api)
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP connections.
+        """
+        await self.api.aclose()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
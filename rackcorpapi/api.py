@@ -1,9 +1,84 @@
-from . import cred
+from . import cred, jsonlib, resolver
+import base64
+import http.cookiejar
 import logging
 import requests
+import requests.auth
+import urllib3.util
 
 logger = logging.getLogger(__name__)
 
+_SHARED_SESSION: requests.Session = None
+
+
+def _shared_session() -> requests.Session:
+    """
+    Get the process-wide session, creating it on first use.
+
+    Sharing one session lets every client reuse pooled keep-alive connections
+    instead of paying a fresh TCP and TLS handshake per client.
+    """
+    global _SHARED_SESSION
+    if _SHARED_SESSION is None:
+        retry = urllib3.util.Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+        )
+        session = requests.Session()
+        # Share connections, not state: a cookie set for one client's
+        # credential must never be sent by another client.
+        session.cookies.set_policy(
+            http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+        )
+        session.mount(
+            "https://",
+            resolver.CachedDnsAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=retry,
+            ),
+        )
+        _SHARED_SESSION = session
+    return _SHARED_SESSION
+
+
+def parse_json(response) -> dict:
+    """
+    Parse the JSON body of a requests or httpx response.
+
+    A body that is not JSON raises requests' JSONDecodeError, which is a
+    RequestException like every other API error.
+
+    :return: The parsed JSON body.
+    """
+    try:
+        return jsonlib.loads(response.content)
+    except ValueError as e:
+        raise requests.exceptions.JSONDecodeError(
+            getattr(e, "msg", str(e)),
+            response.text,
+            getattr(e, "pos", 0),
+            response=response,
+        ) from e
+
+
+class _PresetAuth(requests.auth.AuthBase):
+    """
+    Sets a precomputed Authorization header on each request.
+
+    Passing an auth object, rather than only a default header, also stops
+    requests from looking up ~/.netrc for every request.
+    """
+
+    def __init__(self, header: str):
+        self.header = header
+
+    def __call__(self, r: requests.PreparedRequest) -> requests.PreparedRequest:
+        r.headers["Authorization"] = self.header
+        return r
+
 
 class _api:
     """
@@ -24,42 +99,84 @@ class _api:
         self.base_url = base_url
         self.api_version = api_version
         self.user_agent = user_agent
-        self.session = requests.Session()
+        self.session = _shared_session()
+        self._prefix = base_url + api_version + "/"
+        self._legacy_url = base_url + "rest/" + api_version + "/json.php"
+        self._headers = {
+            "Accept": "application/json",
+            "User-Agent": user_agent,
+        }
+        self._body_headers = {
+            **self._headers,
+            "Content-Type": "application/json",
+        }
+        token = base64.b64encode(f"{cred.api_uuid}:{cred.api_secret}".encode())
+        self._auth = _PresetAuth(f"Basic {token.decode()}")
+        # url_suffix -> (conditional request headers, parsed body)
+        self._validated = {}
 
     def api_request(
-        self, method: str, url_suffix: str, req_body=None
+        self, method: str, url: str, req_body=None, headers: dict = None
     ) -> requests.Response:
-        headers = {
-            "Accept": "application/json",
-            "User-Agent": self.user_agent,
-        }
-        req = requests.Request(
+        data = None
+        req_headers = self._headers
+        if req_body is not None:
+            data = jsonlib.dumps(req_body)
+            req_headers = self._body_headers
+        if headers:
+            req_headers = {**req_headers, **headers}
+        resp = self.session.request(
             method,
-            self.base_url + url_suffix,
-            headers=headers,
-            auth=self.cred.http_basic_auth(),
-            json=req_body,
-        )
-        prep = req.prepare()
-        logging.debug(f"request: {prep.method} {prep.url}")
-        resp = self.session.send(
-            prep,
+            url,
+            headers=req_headers,
+            auth=self._auth,
+            data=data,
             timeout=30,  # seconds
         )
-        logging.debug(f"response: {resp.status_code}")
+        logger.debug("request: %s %s", resp.request.method, resp.request.url)
+        logger.debug("response: %s", resp.status_code)
         return resp
 
-    def api_get(self, url_suffix: str) -> requests.Response:
-        return self.api_request("GET", f"{self.api_version}/{url_suffix}")
+    def api_get(self, url_suffix: str, headers: dict = None) -> requests.Response:
+        return self.api_request("GET", self._prefix + url_suffix, headers=headers)
+
+    def api_get_json(self, url_suffix: str) -> dict:
+        """
+        GET a resource and parse its JSON body.
+
+        If an earlier response carried an ETag or Last-Modified header, the
+        request is made conditional and a 304 reuses the earlier parsed body.
+
+        :return: The parsed JSON body.
+        """
+        validated = self._validated.get(url_suffix)
+        response = self.api_get(url_suffix, validated[0] if validated else None)
+        if response.status_code == 304 and validated:
+            return validated[1]
+
+        body = self.parse_response(response)
+
+        conditions = {}
+        etag = response.headers.get("ETag")
+        if etag:
+            conditions["If-None-Match"] = etag
+        last_modified = response.headers.get("Last-Modified")
+        if last_modified:
+            conditions["If-Modified-Since"] = last_modified
+        if conditions:
+            self._validated[url_suffix] = (conditions, body)
+        else:
+            self._validated.pop(url_suffix, None)
+        return body
 
     def api_delete(self, url_suffix: str) -> requests.Response:
-        return self.api_request("DELETE", f"{self.api_version}/{url_suffix}")
+        return self.api_request("DELETE", self._prefix + url_suffix)
 
     def api_post(self, url_suffix: str, req_body) -> requests.Response:
-        return self.api_request("POST", f"{self.api_version}/{url_suffix}", req_body)
+        return self.api_request("POST", self._prefix + url_suffix, req_body)
 
     def api_legacy_post(self, req_body) -> requests.Response:
-        return self.api_request("POST", f"rest/{self.api_version}/json.php", req_body)
+        return self.api_request("POST", self._legacy_url, req_body)
 
     def raise_request_exception(self, response: requests.Response):
         response.raise_for_status()
@@ -67,11 +184,25 @@ class _api:
             f"Error {response.status_code}: {response.text}", response=response
         )
 
-    def raise_if_json_code_not_ok(self, json_body: dict) -> None:
+    def parse_response(self, response: requests.Response) -> dict:
+        """
+        Check a response and parse its JSON body exactly once.
+
+        :return: The parsed JSON body.
+        """
+        if response.status_code != 200:
+            self.raise_request_exception(response)
+
+        body = parse_json(response)
+        self.raise_if_json_code_not_ok(body)
+        return body
+
+    @staticmethod
+    def raise_if_json_code_not_ok(json_body: dict) -> None:
         code = json_body.get("code")
         msg = json_body.get("message")
         debug = json_body.get("debug")
         if code != "OK":
             if debug:
-                logger.debug(f"API error debug info: {debug}")
+                logger.debug("API error debug info: %s", debug)
             raise requests.RequestException(f"Error code '{code}': {msg}")
@@ -0,0 +1,92 @@
+import json
+import os
+import time
+
+CACHE_DIR = os.path.expanduser("~/.cache/rackcorp")
+
+
+def _path(name: str) -> str:
+    return os.path.join(CACHE_DIR, name)
+
+
+def load(name: str) -> dict:
+    """
+    Load a JSON cache file.
+
+    :param name: The file name within the cache directory.
+    :return: The cached entries, or an empty dict if the file is missing or unreadable.
+    """
+    try:
+        with open(_path(name), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return data
+
+
+def store(name: str, data: dict) -> None:
+    """
+    Atomically write a JSON cache file, readable only by the current user.
+
+    The cache is only an optimisation, so write failures are ignored.
+
+    :param name: The file name within the cache directory.
+    :param data: The entries to write.
+    """
+    path = _path(name)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def get(name: str, key: str):
+    """
+    Get an unexpired value from a JSON cache file.
+
+    :param name: The file name within the cache directory.
+    :param key: The entry key.
+    :return: The cached value, or None if it is missing or expired.
+    """
+    entry = load(name).get(key)
+    if not isinstance(entry, dict) or entry.get("expires", 0) <= time.time():
+        return None
+    return entry.get("value")
+
+
+def put(name: str, key: str, value, ttl: float) -> None:
+    """
+    Store a value in a JSON cache file, dropping any expired entries.
+
+    :param name: The file name within the cache directory.
+    :param key: The entry key.
+    :param value: A JSON-serialisable value.
+    :param ttl: The number of seconds the value stays valid.
+    """
+    now = time.time()
+    data = {
+        k: entry
+        for k, entry in load(name).items()
+        if isinstance(entry, dict) and entry.get("expires", 0) > now
+    }
+    data[key] = {"expires": now + ttl, "value": value}
+    store(name, data)
+
+
+def delete(name: str, key: str) -> None:
+    """
+    Remove an entry from a JSON cache file.
+
+    :param name: The file name within the cache directory.
+    :param key: The entry key.
+    """
+    data = load(name)
+    if data.pop(key, None) is not None:
+        store(name, data)
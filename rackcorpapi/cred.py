@@ -1,6 +1,6 @@
 import requests
 import requests.auth
-import configparser
+import functools
 import os
 
 
@@ -28,28 +28,43 @@ class ApiCredential:
         return requests.auth.HTTPBasicAuth(self.api_uuid, self.api_secret)
 
 
+@functools.lru_cache(maxsize=1)
 def get_api_credentials() -> ApiCredential:
     """
     Find API credentials in the execution environment.
+
+    The result is cached for the life of the process; call
+    ``get_api_credentials.cache_clear()`` after changing the environment or
+    config files, e.g. in tests.
+
     :return: An instance of RackcorpApiCredential with loaded credentials or None.
     """
-    api_uuid = os.getenv("RACKCORP_API_UUID", "").strip()
-    api_secret = os.getenv("RACKCORP_API_SECRET", "").strip()
+    api_uuid = os.environ.get("RACKCORP_API_UUID")
+    api_secret = os.environ.get("RACKCORP_API_SECRET")
     if api_uuid and api_secret:
-        return ApiCredential(api_uuid, api_secret)
+        api_uuid = api_uuid.strip()
+        api_secret = api_secret.strip()
+        if api_uuid and api_secret:
+            return ApiCredential(api_uuid, api_secret)
 
     config_paths = [
         os.path.expanduser("~/.rackcorp"),
         os.path.expanduser("~/.config/rackcorp/config"),
     ]
+    config_paths = [path for path in config_paths if os.path.exists(path)]
+    if not config_paths:
+        return None
+
+    # Only needed when a config file exists, so keep it off the env var path.
+    import configparser
+
     for path in config_paths:
-        if os.path.exists(path):
-            config = configparser.ConfigParser()
-            config.read(path)
-            if config and "general" in config:
-                api_uuid = config["general"].get("apiuuid", "").strip()
-                api_secret = config["general"].get("apisecret", "").strip()
-                if api_uuid and api_secret:
-                    return ApiCredential(api_uuid, api_secret)
+        config = configparser.ConfigParser()
+        config.read(path)
+        if config and "general" in config:
+            api_uuid = config["general"].get("apiuuid", "").strip()
+            api_secret = config["general"].get("apisecret", "").strip()
+            if api_uuid and api_secret:
+                return ApiCredential(api_uuid, api_secret)
 
     return None
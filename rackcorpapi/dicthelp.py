@@ -1,5 +1,18 @@
-def get_first(d: dict, keys: list, default=None):
-    for key in keys:
-        if key in d:
-            return d[key]
-    return default
+def fold_keys(d: dict, aliases: dict) -> dict:
+    """
+    Fold alias keys onto their canonical key.
+
+    Keys already present win over aliases, and earlier aliases win over later
+    ones. The input is copied only if a key has to be added.
+
+    :param d: The dict to fold.
+    :param aliases: A mapping of alias key to canonical key.
+    :return: A dict with the canonical keys populated.
+    """
+    folded = d
+    for alias, key in aliases.items():
+        if alias in d and key not in folded:
+            if folded is d:
+                folded = dict(d)
+            folded[key] = d[alias]
+    return folded
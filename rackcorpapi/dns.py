@@ -1,4 +1,4 @@
-from . import api, dicthelp
+from . import api, cache, dicthelp
 from .strenum import StrEnum
 import dataclasses
 import enum
@@ -18,7 +18,21 @@ class DnsRecordType(StrEnum):
     SRV = "SRV"
 
 
-@dataclasses.dataclass
+# Plain dict lookup, much cheaper than calling the enum per record.
+_TYPE_MAP = {m.value: m for m in DnsRecordType}
+
+# The API is inconsistent about the casing of id keys.
+_KEY_ALIASES = {
+    "customerId": "customerid",
+    "customerID": "customerid",
+    "domainId": "domainid",
+    "domainID": "domainid",
+    "regionId": "regionid",
+    "regionID": "regionid",
+}
+
+
+@dataclasses.dataclass(slots=True)
 class DnsRecord:
     lookup: str  # TODO rename name
     type: DnsRecordType
@@ -38,62 +52,76 @@ class DnsRecord:
 
     @staticmethod
     def from_dict(d: dict) -> "DnsRecord":
+        d = dicthelp.fold_keys(d, _KEY_ALIASES)
         return DnsRecord(
             lookup=d["lookup"],
-            type=DnsRecordType(d["type"]),
+            # Unknown types fall through to the enum so they still raise ValueError.
+            type=_TYPE_MAP.get(d["type"]) or DnsRecordType(d["type"]),
             data=d["data"],
             caa_tag=d.get("caatag"),
             caa_flag=d.get("caaflag"),
-            customer_id=dicthelp.get_first(
-                d, ["customerid", "customerId", "customerID"]
-            ),
-            domain_id=dicthelp.get_first(d, ["domainid", "domainId", "domainID"]),
+            customer_id=d.get("customerid"),
+            domain_id=d.get("domainid"),
             domain_name=d.get("name"),
             id=d.get("id"),
             port=d.get("port"),
             priority=d.get("priority"),
-            region_id=dicthelp.get_first(d, ["regionid", "regionId", "regionID"]),
+            region_id=d.get("regionid"),
             ttl=d.get("ttl"),
             weight=d.get("weight"),
         )
 
     def to_dict(self) -> dict:
         d = {
-            "type": str(self.type),
+            "type": self.type.value,
             "lookup": self.lookup,
             "data": self.data,
         }
 
         if self.domain_id:
-            d["domainid"] = self.domain_id
-            d["domainId"] = self.domain_id
-            d["domainID"] = self.domain_id
+            d["domainid"] = d["domainId"] = d["domainID"] = self.domain_id
         elif self.domain_name:
             d["name"] = self.domain_name
 
-        opts = {
-            "id": self.id,
-            "caatag": self.caa_tag,
-            "caaflag": self.caa_flag,
-            "customerid": self.customer_id,
-            "customerId": self.customer_id,
-            "customerID": self.customer_id,
-            "port": self.port,
-            "priority": self.priority,
-            "regionid": self.region_id,
-            "regionId": self.region_id,
-            "regionID": self.region_id,
-            "ttl": self.ttl,
-            "weight": self.weight,
-        }
-        for key, value in opts.items():
-            if value is not None:
-                d[key] = value
+        if self.id is not None:
+            d["id"] = self.id
+        if self.caa_tag is not None:
+            d["caatag"] = self.caa_tag
+        if self.caa_flag is not None:
+            d["caaflag"] = self.caa_flag
+        if self.customer_id is not None:
+            d["customerid"] = d["customerId"] = d["customerID"] = self.customer_id
+        if self.port is not None:
+            d["port"] = self.port
+        if self.priority is not None:
+            d["priority"] = self.priority
+        if self.region_id is not None:
+            d["regionid"] = d["regionId"] = d["regionID"] = self.region_id
+        if self.ttl is not None:
+            d["ttl"] = self.ttl
+        if self.weight is not None:
+            d["weight"] = self.weight
 
         return d
 
 
-@dataclasses.dataclass
+def _record_update_data(records: list[DnsRecord]) -> dict:
+    """
+    Build the data of a dns.record.update request, keyed by record id.
+
+    :raises ValueError: If a record has no id, or two records share one.
+    """
+    data = {}
+    for r in records:
+        if r.id is None:
+            raise ValueError("Records must have an id to be updated")
+        if r.id in data:
+            raise ValueError(f"Record {r.id} is listed more than once")
+        data[r.id] = r.to_dict()
+    return data
+
+
+@dataclasses.dataclass(slots=True)
 class DnsDomain:
     id: int
     customer_id: int
@@ -106,29 +134,33 @@ class DnsDomain:
 
     @staticmethod
     def from_dict(d: dict) -> "DnsDomain":
-        dom = DnsDomain(
+        d = dicthelp.fold_keys(d, _KEY_ALIASES)
+        return DnsDomain(
             id=d["id"],
-            customer_id=dicthelp.get_first(
-                d, ["customerid", "customerId", "customerID"]
-            ),
+            customer_id=d.get("customerid"),
             serial=d.get("serial"),
             stdname=d.get("stdname"),
             name=d.get("name"),
             type=d.get("type"),
             last_modified=d.get("lastmodified"),
-            records=[],
+            records=[DnsRecord.from_dict(r) for r in d.get("records", ())],
         )
 
-        for r in d.get("records", []):
-            dom.records.append(DnsRecord.from_dict(r))
 
-        return dom
+_DOMAINS_CACHE_FILE = "domains.json"
+_DOMAINS_CACHE_TTL = 600  # seconds
 
 
 class _dnsOperations:
 
     def __init__(self, api: api._api):
         self._api = api
+        self._domains = None
+        self._domain_index = None
+
+    def _domain_getall_data(self) -> typing.Sequence[dict]:
+        body = self._api.api_get_json("dns/domain")
+        return body.get("data", ())
 
     def domain_getall(self) -> list[DnsDomain]:
         """
@@ -136,31 +168,53 @@ class _dnsOperations:
 
         :return: A list of domains.
         """
-        response = self._api.api_get("dns/domain")
-        if response.status_code != 200:
-            self._api.raise_request_exception(response)
+        return [DnsDomain.from_dict(dom) for dom in self._domain_getall_data()]
+
+    def domain_getall_cached(self, refresh: bool = False) -> list[DnsDomain]:
+        """
+        Get all domains, reusing a list fetched within the last ten minutes.
 
-        d = response.json()
-        self._api.raise_if_json_code_not_ok(d)
+        The list is kept for the life of this client and shared with other
+        processes using the same credential through ~/.cache/rackcorp, so it
+        may not include domains created since it was fetched.
 
-        doms = []
-        for dom in d.get("data", []):
-            doms.append(DnsDomain.from_dict(dom))
+        :param refresh: Fetch a new list even if a cached one is available.
+        :return: A list of domains.
+        """
+        if self._domains is not None and not refresh:
+            return self._domains
+
+        key = f"{self._api.cred.api_uuid}@{self._api.base_url}"
+        data = None if refresh else cache.get(_DOMAINS_CACHE_FILE, key)
+        if data is None:
+            data = self._domain_getall_data()
+            cache.put(_DOMAINS_CACHE_FILE, key, data, _DOMAINS_CACHE_TTL)
+
+        doms = [DnsDomain.from_dict(dom) for dom in data]
+        self._domains = doms
+        self._domain_index = None
         return doms
 
+    def domain_index(self, refresh: bool = False) -> dict[str, DnsDomain]:
+        """
+        Get all domains keyed by name, built from domain_getall_cached().
+
+        :param refresh: Fetch a new list even if a cached one is available.
+        :return: A dict of domain name to domain.
+        """
+        doms = self.domain_getall_cached(refresh=refresh)
+        if self._domain_index is None:
+            self._domain_index = {dom.name: dom for dom in doms}
+        return self._domain_index
+
     def domain_get(self, domain_id: str) -> DnsDomain:
         """
         Get a single domain from the Rackcorp API.
 
         :return: A domains with a list of records.
         """
-        response = self._api.api_get(f"dns/domain/{domain_id}")
-        if response.status_code != 200:
-            self._api.raise_request_exception(response)
-
-        d = response.json()
-        self._api.raise_if_json_code_not_ok(d)
-        return DnsDomain.from_dict(d["data"])
+        body = self._api.api_get_json(f"dns/domain/{domain_id}")
+        return DnsDomain.from_dict(body["data"])
 
     def record_get(self, record_id: str) -> DnsRecord:
         """
@@ -168,13 +222,8 @@ class _dnsOperations:
 
         :return: A record.
         """
-        response = self._api.api_get(f"dns/records/{record_id}")
-        if response.status_code != 200:
-            self._api.raise_request_exception(response)
-
-        d = response.json()
-        self._api.raise_if_json_code_not_ok(d)
-        return DnsRecord.from_dict(d["data"])
+        body = self._api.api_get_json(f"dns/records/{record_id}")
+        return DnsRecord.from_dict(body["data"])
 
     def record_delete(self, record_id: str) -> None:
         """
@@ -191,11 +240,7 @@ class _dnsOperations:
                 "id": record_id,
             }
         )
-        if response.status_code != 200:
-            self._api.raise_request_exception(response)
-
-        d = response.json()
-        self._api.raise_if_json_code_not_ok(d)
+        self._api.parse_response(response)
         return None
 
     def record_create(self, record: DnsRecord) -> DnsRecord:
@@ -212,12 +257,8 @@ class _dnsOperations:
         req_body = {"cmd": "dns.record.create", "data": {0: d}}
 
         response = self._api.api_legacy_post(req_body)
-        if response.status_code != 200:
-            self._api.raise_request_exception(response)
-
-        d = response.json()
-        self._api.raise_if_json_code_not_ok(d)
-        return DnsRecord.from_dict(d["data"][0])
+        body = self._api.parse_response(response)
+        return DnsRecord.from_dict(body["data"][0])
 
     def record_update(self, record: DnsRecord) -> DnsRecord:
         """
@@ -225,14 +266,19 @@ class _dnsOperations:
 
         :return: The updated record.
         """
-        d = record.to_dict()
+        return self.record_update_many([record])[0]
 
-        req_body = {"cmd": "dns.record.update", "data": {record.id: d}}
+    def record_update_many(self, records: list[DnsRecord]) -> list[DnsRecord]:
+        """
+        Update several existing DNS records in a single Rackcorp API request.
 
-        response = self._api.api_legacy_post(req_body)
-        if response.status_code != 200:
-            self._api.raise_request_exception(response)
+        :return: The updated records.
+        """
+        if not records:
+            return []
+
+        req_body = {"cmd": "dns.record.update", "data": _record_update_data(records)}
 
-        d = response.json()
-        self._api.raise_if_json_code_not_ok(d)
-        return DnsRecord.from_dict(d["data"][0])
+        response = self._api.api_legacy_post(req_body)
+        body = self._api.parse_response(response)
+        return [DnsRecord.from_dict(r) for r in body["data"]]
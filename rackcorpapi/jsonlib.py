@@ -0,0 +1,19 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    loads = orjson.loads
+else:
+
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    loads = json.loads
@@ -0,0 +1,100 @@
+from . import cache
+import logging
+import requests.adapters
+import socket
+import time
+import urllib3.connection
+import urllib3.connectionpool
+import urllib3.exceptions
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = "dns.json"
+TTL = 300  # seconds
+
+_entries: dict[tuple[str, int], tuple[float, list[str]]] = {}
+
+
+def resolve(host: str, port: int) -> list[str]:
+    """
+    Resolve a host to its addresses, caching the result in memory and on disk.
+
+    :param host: The host name to resolve.
+    :param port: The port that will be connected to.
+    :return: The resolved addresses, or an empty list if resolution failed.
+    """
+    key = (host, port)
+    now = time.time()
+    entry = _entries.get(key)
+    if entry and entry[0] > now:
+        return entry[1]
+
+    addrs = cache.get(CACHE_FILE, f"{host}:{port}")
+    if addrs:
+        # Disk entries can outlive their own TTL here by at most one more TTL.
+        _entries[key] = (now + TTL, addrs)
+        return addrs
+
+    try:
+        infos = socket.getaddrinfo(host, port, socket.AF_UNSPEC, socket.SOCK_STREAM)
+    except socket.gaierror:
+        return []
+
+    addrs = list(dict.fromkeys(info[4][0] for info in infos))
+    _entries[key] = (now + TTL, addrs)
+    cache.put(CACHE_FILE, f"{host}:{port}", addrs, TTL)
+    return addrs
+
+
+def forget(host: str, port: int) -> None:
+    """
+    Drop any cached addresses for a host.
+
+    :param host: The host name.
+    :param port: The port.
+    """
+    _entries.pop((host, port), None)
+    cache.delete(CACHE_FILE, f"{host}:{port}")
+
+
+class _CachedDnsHTTPSConnection(urllib3.connection.HTTPSConnection):
+    def _new_conn(self):
+        host = self._dns_host
+        addrs = resolve(host, self.port)
+        if not addrs:
+            # Let urllib3 resolve again and report the failure itself.
+            return super()._new_conn()
+
+        # urllib3 connects to _dns_host; TLS still verifies against the
+        # original host once it is restored below.
+        err = None
+        try:
+            for addr in addrs:
+                self._dns_host = addr
+                try:
+                    return super()._new_conn()
+                except urllib3.exceptions.ConnectTimeoutError as e:
+                    err = e
+        finally:
+            self._dns_host = host
+
+        logger.debug("cached addresses for %s failed, forgetting them", host)
+        forget(host, self.port)
+        raise err
+
+
+class _CachedDnsHTTPSConnectionPool(urllib3.connectionpool.HTTPSConnectionPool):
+    ConnectionCls = _CachedDnsHTTPSConnection
+
+
+class CachedDnsAdapter(requests.adapters.HTTPAdapter):
+    """
+    HTTP adapter that resolves HTTPS hosts through the address cache.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            **self.poolmanager.pool_classes_by_scheme,
+            "https": _CachedDnsHTTPSConnectionPool,
+        }
@@ -0,0 +1,37 @@
+from functools import lru_cache
+import pytest
+import responses
+import rackcorpapi
+
+
+@lru_cache(maxsize=None)
+def make_domain(id_, name):
+    # Shared across tests, so callers must not mutate the result
+    return rackcorpapi.DnsDomain.from_dict({"id": id_, "name": name})
+
+
+@pytest.fixture(autouse=True)
+def http_mock():
+    # Any request without a registered response fails fast instead of
+    # reaching the network.
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as r:
+        yield r
+
+
+@pytest.fixture
+def client():
+    # Initialize the API client with mock configuration. Built per test since
+    # clients keep ETag and domain-list state; pooled connections are shared
+    # anyway.
+    return rackcorpapi.Client(
+        credential=rackcorpapi.ApiCredential(
+            api_uuid="mock_api_uuid",
+            api_secret="mock_api_secret",
+        ),
+        base_url="https://api.mock.rackcorp.net",
+    )
+
+
+@pytest.fixture
+def domain():
+    return make_domain
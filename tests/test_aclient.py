@@ -0,0 +1,106 @@
+import asyncio
+import base64
+import json
+import unittest
+from unittest import mock
+import requests
+import rackcorpapi
+
+try:
+    import httpx
+    from rackcorpapi import aclient
+except ImportError:
+    httpx = None
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncRecordUpdate(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = aclient.AsyncClient(
+            credential=rackcorpapi.ApiCredential(
+                api_uuid="mock_api_uuid",
+                api_secret="mock_api_secret",
+            ),
+            base_url="https://api.mock.rackcorp.net",
+            user_agent="mock-agent",
+            transport=httpx.MockTransport(self._handle),
+        )
+        self.addAsyncCleanup(self.client.aclose)
+
+    @staticmethod
+    def _handle(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/rest/v2.8/json.php"
+        assert (
+            request.headers["Authorization"]
+            == "Basic " + base64.b64encode(b"mock_api_uuid:mock_api_secret").decode()
+        )
+        assert request.headers["Content-Type"] == "application/json"
+        assert request.headers["Accept"] == "application/json"
+        assert request.headers["User-Agent"] == "mock-agent"
+        ((record_id, record),) = json.loads(request.content)["data"].items()
+        return httpx.Response(
+            200, json={"code": "OK", "data": [{**record, "id": record_id}]}
+        )
+
+    async def test_record_update_gather(self):
+        records = [
+            rackcorpapi.DnsRecord(
+                id=str(i),
+                lookup=f"host{i}",
+                type=rackcorpapi.DnsRecordType.A,
+                data=f"192.0.2.{i}",
+            )
+            for i in range(3)
+        ]
+        updated = await asyncio.gather(
+            *[self.client.dns.record_update(r) for r in records]
+        )
+        self.assertEqual([r.id for r in updated], ["0", "1", "2"])
+        self.assertEqual(updated[2].data, "192.0.2.2")
+
+    async def test_record_update_many_checks_ids(self):
+        record = rackcorpapi.DnsRecord(
+            id="1", lookup="www", type=rackcorpapi.DnsRecordType.A, data="x"
+        )
+        with mock.patch.object(self.client.api, "api_legacy_post") as post:
+            self.assertEqual(await self.client.dns.record_update_many([]), [])
+            with self.assertRaises(ValueError):
+                await self.client.dns.record_update_many([record, record])
+        post.assert_not_called()
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncParseResponse(unittest.IsolatedAsyncioTestCase):
+    def _client(self, response: "httpx.Response") -> "aclient.AsyncClient":
+        client = aclient.AsyncClient(
+            credential=rackcorpapi.ApiCredential(
+                api_uuid="mock_api_uuid",
+                api_secret="mock_api_secret",
+            ),
+            base_url="https://api.mock.rackcorp.net",
+            transport=httpx.MockTransport(lambda request: response),
+        )
+        self.addAsyncCleanup(client.aclose)
+        return client
+
+    async def test_record_get_non_json(self):
+        client = self._client(httpx.Response(200, text="<html>maintenance</html>"))
+
+        with self.assertRaises(requests.exceptions.JSONDecodeError) as cm:
+            await client.dns.record_get("9")
+        self.assertIsInstance(cm.exception, requests.RequestException)
+
+    async def test_record_get_server_error(self):
+        client = self._client(httpx.Response(500, text="Internal Server Error"))
+
+        with self.assertRaises(requests.HTTPError) as cm:
+            await client.dns.record_get("9")
+        self.assertEqual(cm.exception.response.status_code, 500)
+
+    async def test_record_get_api_error(self):
+        client = self._client(
+            httpx.Response(200, json={"code": "FAULT", "message": "Record not found"})
+        )
+
+        with self.assertRaisesRegex(requests.RequestException, "Record not found"):
+            await client.dns.record_get("9")
@@ -0,0 +1,62 @@
+import json
+from unittest import mock
+import rackcorpapi
+
+
+def test_api_get_json_revalidates_with_etag(client):
+    client.api.session = mock.Mock()
+    client.api.session.request.side_effect = [
+        mock.Mock(
+            status_code=200,
+            headers={"ETag": '"v1"'},
+            content=b'{"code": "OK", "data": []}',
+        ),
+        mock.Mock(status_code=304, headers={}),
+    ]
+
+    body = client.api.api_get_json("dns/domain")
+    assert body == {"code": "OK", "data": []}
+    assert client.api.api_get_json("dns/domain") is body
+
+    first, second = client.api.session.request.call_args_list
+    assert "If-None-Match" not in first.kwargs["headers"]
+    assert second.kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert second.kwargs["headers"]["Accept"] == "application/json"
+
+
+def test_api_request_serializes_body(client):
+    client.api.session = mock.Mock()
+    client.api.api_legacy_post({"cmd": "dns.record.create", "data": {0: {}}})
+
+    args, kwargs = client.api.session.request.call_args
+    assert args == ("POST", "https://api.mock.rackcorp.net/rest/v2.8/json.php")
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+    assert json.loads(kwargs["data"]) == {
+        "cmd": "dns.record.create",
+        "data": {"0": {}},
+    }
+
+
+def test_shared_session_does_not_share_cookies(http_mock):
+    alice, bob = (
+        rackcorpapi.Client(
+            credential=rackcorpapi.ApiCredential(
+                api_uuid=name,
+                api_secret="mock_api_secret",
+            ),
+            base_url="https://api.mock.rackcorp.net",
+        )
+        for name in ("alice", "bob")
+    )
+    assert alice.api.session is bob.api.session
+    http_mock.get(
+        "https://api.mock.rackcorp.net/v2.8/dns/domain",
+        json={"code": "OK", "data": []},
+        headers={"Set-Cookie": "PHPSESSID=alice-session; Path=/"},
+    )
+
+    alice.dns.domain_getall()
+    bob.dns.domain_getall()
+
+    assert "Cookie" not in http_mock.calls[1].request.headers
+    assert not alice.api.session.cookies
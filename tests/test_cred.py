@@ -0,0 +1,42 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import rackcorpapi
+
+
+class TestGetApiCredentials(unittest.TestCase):
+    def setUp(self):
+        home = tempfile.TemporaryDirectory()
+        self.addCleanup(home.cleanup)
+        patcher = mock.patch.dict(
+            os.environ,
+            {
+                "HOME": home.name,
+                "RACKCORP_API_UUID": "env_api_uuid",
+                "RACKCORP_API_SECRET": "env_api_secret",
+            },
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        rackcorpapi.get_api_credentials.cache_clear()
+        self.addCleanup(rackcorpapi.get_api_credentials.cache_clear)
+
+    def test_get_api_credentials_from_env(self):
+        cred = rackcorpapi.get_api_credentials()
+        self.assertEqual(cred.api_uuid, "env_api_uuid")
+        self.assertEqual(cred.api_secret, "env_api_secret")
+        self.assertIs(rackcorpapi.get_api_credentials(), cred)
+
+    def test_get_api_credentials_from_config(self):
+        del os.environ["RACKCORP_API_UUID"]
+        with open(os.path.join(os.environ["HOME"], ".rackcorp"), "w") as f:
+            f.write("[general]\napiuuid = file_api_uuid\napisecret = file_api_secret\n")
+
+        cred = rackcorpapi.get_api_credentials()
+        self.assertEqual(cred.api_uuid, "file_api_uuid")
+        self.assertEqual(cred.api_secret, "file_api_secret")
+
+    def test_get_api_credentials_missing(self):
+        del os.environ["RACKCORP_API_SECRET"]
+        self.assertIsNone(rackcorpapi.get_api_credentials())
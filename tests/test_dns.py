@@ -1,40 +1,209 @@
-import unittest
+import json
+from unittest import mock
+import pytest
+import requests
 import rackcorpapi
+from rackcorpapi import cache
 
-# TODO unit test rackcorpapi.get_api_credentials()
 
+def test_dns_domain_getall(client, domain):
+    # Mock response data
+    mock_response = [domain(1, "example.com"), domain(7, "test.com")]
+
+    # Mock the API call; the patch is undone on exit
+    with mock.patch.object(
+        client.dns, "domain_getall", autospec=True, return_value=mock_response
+    ) as mock_getall:
+        # Call the method
+        response = client.dns.domain_getall()
+
+    mock_getall.assert_called_once_with()
+
+    # Assertions
+    assert isinstance(response, list)
+    assert len(response) == 2
+    assert all(isinstance(dom, rackcorpapi.DnsDomain) for dom in response)
+    assert [(dom.id, dom.name) for dom in response] == [
+        (1, "example.com"),
+        (7, "test.com"),
+    ]
+
+
+def test_dns_domain_get(client, http_mock):
+    http_mock.get(
+        "https://api.mock.rackcorp.net/v2.8/dns/domain/1",
+        json={
+            "code": "OK",
+            "data": {
+                "id": 1,
+                "name": "example.com",
+                "records": [
+                    {"id": "9", "lookup": "www", "type": "A", "data": "192.0.2.1"},
+                ],
+            },
+        },
+    )
+
+    dom = client.dns.domain_get(1)
+
+    assert dom.name == "example.com"
+    assert dom.records[0].type is rackcorpapi.DnsRecordType.A
+    request = http_mock.calls[0].request
+    assert request.headers["Authorization"].startswith("Basic ")
+
+
+def test_dns_record_get_error(client, http_mock):
+    http_mock.get(
+        "https://api.mock.rackcorp.net/v2.8/dns/records/9",
+        json={"code": "FAULT", "message": "Record not found"},
+    )
+
+    with pytest.raises(requests.RequestException, match="Record not found"):
+        client.dns.record_get(9)
+
+
+def test_dns_record_get_non_json(client, http_mock):
+    http_mock.get(
+        "https://api.mock.rackcorp.net/v2.8/dns/records/9",
+        body="<html>maintenance</html>",
+    )
+
+    with pytest.raises(requests.RequestException) as excinfo:
+        client.dns.record_get(9)
+    assert isinstance(excinfo.value, requests.exceptions.JSONDecodeError)
+    assert excinfo.value.response.status_code == 200
+
+
+@pytest.fixture
+def cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "CACHE_DIR", str(tmp_path))
+
+
+def _mock_domain_list(client):
+    client.api.api_get_json = mock.Mock(
+        return_value={
+            "code": "OK",
+            "data": [{"id": 1, "name": "example.com"}],
+        }
+    )
+    return client
 
-class TestDNSDomainGetAll(unittest.TestCase):
-    def setUp(self):
 
-        # Initialize the API client with mock configuration
-        self.client = rackcorpapi.Client(
-            credential=rackcorpapi.ApiCredential(
-                api_uuid="mock_api_uuid",
-                api_secret="mock_api_secret",
-            ),
-            base_url="https://api.mock.rackcorp.net",
+def test_dns_domain_getall_cached(client, cache_dir):
+    first = _mock_domain_list(client)
+    assert first.dns.domain_getall_cached()[0].name == "example.com"
+    first.dns.domain_getall_cached()
+    first.api.api_get_json.assert_called_once_with("dns/domain")
+
+    # A client in another process shares the listing through the disk cache.
+    second = _mock_domain_list(
+        rackcorpapi.Client(credential=client.api.cred, base_url=client.api.base_url)
+    )
+    assert second.dns.domain_getall_cached()[0].id == 1
+    second.api.api_get_json.assert_not_called()
+
+    second.dns.domain_getall_cached(refresh=True)
+    second.api.api_get_json.assert_called_once_with("dns/domain")
+
+
+def test_dns_domain_index(client, cache_dir):
+    _mock_domain_list(client)
+    index = client.dns.domain_index()
+    assert index["example.com"].id == 1
+    assert client.dns.domain_index() is index
+    assert client.dns.domain_index(refresh=True) is not index
+
+
+def test_dns_record_from_dict():
+    record = rackcorpapi.DnsRecord.from_dict(
+        {
+            "id": "42",
+            "lookup": "_acme-challenge.www",
+            "type": "TXT",
+            "data": "token",
+            "customerId": 3,
+            "domainid": 1,
+            "ttl": 120,
+        }
+    )
+    assert record.type is rackcorpapi.DnsRecordType.TXT
+    assert record.customer_id == 3
+    assert record.domain_id == 1
+    assert record.region_id is None
+
+    with pytest.raises(ValueError):
+        rackcorpapi.DnsRecord.from_dict({"lookup": "www", "type": "BOGUS", "data": "x"})
+
+
+def test_dns_record_to_dict():
+    record = rackcorpapi.DnsRecord(
+        lookup="_acme-challenge.www",
+        type=rackcorpapi.DnsRecordType.TXT,
+        data="token",
+        customer_id=3,
+        domain_id=1,
+        ttl=120,
+    )
+    assert record.to_dict() == {
+        "type": "TXT",
+        "lookup": "_acme-challenge.www",
+        "data": "token",
+        "domainid": 1,
+        "domainId": 1,
+        "domainID": 1,
+        "customerid": 3,
+        "customerId": 3,
+        "customerID": 3,
+        "ttl": 120,
+    }
+    assert type(record.to_dict()["type"]) is str
+
+
+def test_dns_record_update_many(client):
+    records = [
+        rackcorpapi.DnsRecord(
+            id=str(i),
+            lookup=f"host{i}",
+            type=rackcorpapi.DnsRecordType.A,
+            data=f"192.0.2.{i}",
+        )
+        for i in range(3)
+    ]
+    client.api.api_legacy_post = mock.Mock(
+        return_value=mock.Mock(
+            status_code=200,
+            content=json.dumps(
+                {"code": "OK", "data": [r.to_dict() for r in records]}
+            ).encode(),
         )
+    )
 
-    def test_dns_domain_getall(self):
-        # Mock response data
-        mock_response = [
-            rackcorpapi.DnsDomain.from_dict({"id": 1, "name": "example.com"}),
-            rackcorpapi.DnsDomain.from_dict({"id": 7, "name": "test.com"}),
-        ]
+    updated = client.dns.record_update_many(records)
 
-        # Mock the API call
-        def mock_getall():
-            return mock_response
+    client.api.api_legacy_post.assert_called_once()
+    req_body = client.api.api_legacy_post.call_args.args[0]
+    assert req_body["cmd"] == "dns.record.update"
+    assert list(req_body["data"]) == ["0", "1", "2"]
+    assert updated == records
 
-        self.client.dns.domain_getall = mock_getall
 
-        # Call the method
-        response = self.client.dns.domain_getall()
-
-        # Assertions
-        self.assertIsInstance(response, list)
-        self.assertEqual(len(response), 2)
-        self.assertIsInstance(response[0], rackcorpapi.DnsDomain)
-        self.assertEqual(response[0].name, "example.com")
-        self.assertEqual(response[1].id, 7)
+def test_dns_record_update_many_empty(client):
+    client.api.api_legacy_post = mock.Mock()
+
+    assert client.dns.record_update_many([]) == []
+    client.api.api_legacy_post.assert_not_called()
+
+
+@pytest.mark.parametrize("ids", [["1", None], ["1", "1"]], ids=["missing", "duplicate"])
+def test_dns_record_update_many_invalid_ids(client, ids):
+    records = [
+        rackcorpapi.DnsRecord(
+            id=record_id, lookup="www", type=rackcorpapi.DnsRecordType.A, data="x"
+        )
+        for record_id in ids
+    ]
+    client.api.api_legacy_post = mock.Mock()
+
+    with pytest.raises(ValueError):
+        client.dns.record_update_many(records)
+    client.api.api_legacy_post.assert_not_called()
@@ -0,0 +1,145 @@
+import importlib
+import sys
+import unittest
+from unittest import mock
+import requests
+import rackcorpapi
+
+# The module dispatches on sys.argv at import, so import it without arguments.
+with mock.patch.object(sys, "argv", ["rackcorpapi"]):
+    main = importlib.import_module("rackcorpapi.__main__")
+
+
+class TestFindRecordId(unittest.TestCase):
+    def setUp(self):
+        self.record = rackcorpapi.DnsRecord(
+            lookup="_acme-challenge.www",
+            type=rackcorpapi.DnsRecordType.TXT,
+            data="token",
+            domain_id=1,
+            domain_name="example.com",
+        )
+        self.client = mock.Mock()
+        self.client.dns.domain_index.return_value = {
+            "example.com": rackcorpapi.DnsDomain.from_dict(
+                {"id": 2, "name": "example.com"}
+            )
+        }
+
+    def test_retries_with_refreshed_domain_id(self):
+        self.client.dns.domain_get.side_effect = [
+            requests.HTTPError("Domain not found"),
+            rackcorpapi.DnsDomain.from_dict(
+                {
+                    "id": 2,
+                    "name": "example.com",
+                    "records": [
+                        {
+                            "id": "9",
+                            "lookup": "_acme-challenge.www",
+                            "type": "TXT",
+                            "data": "old",
+                        }
+                    ],
+                }
+            ),
+        ]
+
+        self.assertEqual(main._find_record_id(self.client, self.record), "9")
+
+        self.client.dns.domain_index.assert_called_once_with(refresh=True)
+        self.assertEqual(
+            self.client.dns.domain_get.call_args_list, [mock.call(1), mock.call(2)]
+        )
+        self.assertEqual(self.record.domain_id, 2)
+
+    def test_reraises_when_domain_id_is_current(self):
+        self.record.domain_id = 2
+        self.client.dns.domain_get.side_effect = requests.HTTPError("Server error")
+
+        with self.assertRaises(requests.HTTPError):
+            main._find_record_id(self.client, self.record)
+
+        self.client.dns.domain_get.assert_called_once_with(2)
+
+
+@unittest.skipIf(main.dnsresolver is None, "dnspython is not installed")
+class TestWaitForPropagation(unittest.TestCase):
+    def setUp(self):
+        self.record = rackcorpapi.DnsRecord(
+            lookup="_acme-challenge.www",
+            type=rackcorpapi.DnsRecordType.TXT,
+            data="token",
+            domain_name="example.com",
+        )
+
+        # Fake clock that only advances when the code sleeps
+        self.now = 0.0
+        self.sleeps = []
+
+        def sleep(seconds):
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+        for name, fake in (("monotonic", lambda: self.now), ("sleep", sleep)):
+            patcher = mock.patch.object(main.time, name, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.resolver = mock.Mock()
+        patcher = mock.patch.object(
+            main.dnsresolver, "Resolver", return_value=self.resolver
+        )
+        self.Resolver = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _patch_ns_lookup(self, **kwargs):
+        patcher = mock.patch.object(main.dnsresolver, "resolve", **kwargs)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def _resolve_ns(self, qname, rdtype):
+        if rdtype == "NS":
+            return [mock.Mock(target="ns1.example.com.")]
+        return [mock.Mock(address="192.0.2.53")]
+
+    @staticmethod
+    def _txt(value: bytes):
+        return [mock.Mock(strings=(value,))]
+
+    def test_record_found_after_polls(self):
+        self._patch_ns_lookup(side_effect=self._resolve_ns)
+        self.resolver.resolve.side_effect = [
+            main.dnsresolver.NXDOMAIN(),
+            self._txt(b"stale"),
+            self._txt(b"token"),
+        ]
+
+        self.assertTrue(main._wait_for_propagation(self.record))
+
+        self.Resolver.assert_called_once_with(configure=False)
+        self.assertEqual(self.resolver.nameservers, ["192.0.2.53"])
+        self.assertEqual(self.resolver.resolve.call_count, 3)
+        self.resolver.resolve.assert_called_with(
+            "_acme-challenge.www.example.com",
+            "TXT",
+            lifetime=main.PROPAGATION_TIMEOUT - 1.5,
+        )
+        self.assertEqual(self.sleeps, [0.5, 1.0])
+
+    def test_times_out(self):
+        self._patch_ns_lookup(side_effect=self._resolve_ns)
+        self.resolver.resolve.side_effect = main.dnsresolver.NXDOMAIN()
+
+        self.assertFalse(main._wait_for_propagation(self.record))
+
+        self.assertEqual(self.sleeps[:5], [0.5, 1.0, 2.0, 4.0, 5])
+        self.assertEqual(sum(self.sleeps), main.PROPAGATION_TIMEOUT)
+
+    def test_name_server_lookup_fails(self):
+        self._patch_ns_lookup(side_effect=main.dnsresolver.NoNameservers())
+
+        self.assertFalse(main._wait_for_propagation(self.record))
+
+        self.Resolver.assert_not_called()
+        self.assertEqual(self.sleeps, [main.PROPAGATION_FALLBACK_DELAY])
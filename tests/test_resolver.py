@@ -0,0 +1,84 @@
+import socket
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import urllib3.exceptions
+
+from rackcorpapi import cache, resolver
+
+
+class TestResolve(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = mock.patch.object(cache, "CACHE_DIR", tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        resolver._entries.clear()
+        self.addCleanup(resolver._entries.clear)
+
+    def test_resolve_persists_addresses(self):
+        infos = [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.1", 443)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.1", 443)),
+            (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("2001:db8::1", 443, 0, 0)),
+        ]
+        with mock.patch("socket.getaddrinfo", return_value=infos) as getaddrinfo:
+            self.assertEqual(
+                resolver.resolve("api.example.net", 443),
+                ["192.0.2.1", "2001:db8::1"],
+            )
+            # A fresh process only has the on-disk cache.
+            resolver._entries.clear()
+            self.assertEqual(
+                resolver.resolve("api.example.net", 443),
+                ["192.0.2.1", "2001:db8::1"],
+            )
+        getaddrinfo.assert_called_once()
+
+    def test_forget(self):
+        cache.put(resolver.CACHE_FILE, "api.example.net:443", ["192.0.2.1"], 60)
+        resolver.forget("api.example.net", 443)
+        with mock.patch("socket.getaddrinfo", side_effect=socket.gaierror):
+            self.assertEqual(resolver.resolve("api.example.net", 443), [])
+
+    def _listen(self) -> int:
+        # Listen on 127.0.0.1 only, so 127.0.0.2 on the same port is refused.
+        server = socket.socket()
+        self.addCleanup(server.close)
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        return server.getsockname()[1]
+
+    def test_new_conn_tries_next_address(self):
+        port = self._listen()
+        resolver._entries[("api.example.net", port)] = (
+            time.time() + 60,
+            ["127.0.0.2", "127.0.0.1"],
+        )
+        conn = resolver._CachedDnsHTTPSConnection("api.example.net", port, timeout=2)
+
+        sock = conn._new_conn()
+        self.addCleanup(sock.close)
+
+        self.assertEqual(sock.getpeername(), ("127.0.0.1", port))
+        self.assertEqual(conn.host, "api.example.net")
+        self.assertIn(("api.example.net", port), resolver._entries)
+
+    def test_new_conn_forgets_failed_addresses(self):
+        port = self._listen()
+        resolver._entries[("api.example.net", port)] = (
+            time.time() + 60,
+            ["127.0.0.2", "127.0.0.3"],
+        )
+        conn = resolver._CachedDnsHTTPSConnection("api.example.net", port, timeout=2)
+
+        with mock.patch.object(resolver, "forget", wraps=resolver.forget) as forget:
+            with self.assertRaises(urllib3.exceptions.NewConnectionError):
+                conn._new_conn()
+
+        forget.assert_called_once_with("api.example.net", port)
+        self.assertNotIn(("api.example.net", port), resolver._entries)
+        self.assertEqual(conn.host, "api.example.net")